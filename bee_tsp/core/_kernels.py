@@ -0,0 +1,65 @@
+"""
+Numba-compiled tour scoring kernels.
+Numba is optional: without it NUMBA_AVAILABLE is False and callers
+stay on the NumPy paths in bee_tsp.core.distance.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels below still import."""
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+@njit(cache=True)
+def tour_length_euc(xy: np.ndarray, tour: np.ndarray) -> int:
+    """EUC_2D closed tour length: sum of rounded edge lengths."""
+    n = tour.shape[0]
+    if n == 0:
+        return 0
+    s = 0
+    for i in range(n - 1):
+        a = tour[i]
+        b = tour[i + 1]
+        dx = xy[a, 0] - xy[b, 0]
+        dy = xy[a, 1] - xy[b, 1]
+        s += np.int64(np.rint(math.sqrt(dx * dx + dy * dy)))
+    # Closing edge, kept out of the loop so the body has no wrap-around
+    a = tour[n - 1]
+    b = tour[0]
+    dx = xy[a, 0] - xy[b, 0]
+    dy = xy[a, 1] - xy[b, 1]
+    s += np.int64(np.rint(math.sqrt(dx * dx + dy * dy)))
+    return s
+
+
+@njit(cache=True)
+def tour_length_ceil(xy: np.ndarray, tour: np.ndarray) -> int:
+    """CEIL_2D closed tour length: sum of ceiled edge lengths."""
+    n = tour.shape[0]
+    if n == 0:
+        return 0
+    s = 0
+    for i in range(n - 1):
+        a = tour[i]
+        b = tour[i + 1]
+        dx = xy[a, 0] - xy[b, 0]
+        dy = xy[a, 1] - xy[b, 1]
+        s += np.int64(math.ceil(math.sqrt(dx * dx + dy * dy)))
+    # Closing edge, kept out of the loop so the body has no wrap-around
+    a = tour[n - 1]
+    b = tour[0]
+    dx = xy[a, 0] - xy[b, 0]
+    dy = xy[a, 1] - xy[b, 1]
+    s += np.int64(math.ceil(math.sqrt(dx * dx + dy * dy)))
+    return s
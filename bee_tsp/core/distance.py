@@ -1,65 +1,192 @@
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional
 from pathlib import Path
 import math
+import weakref
 
-Coord = Tuple[float, float]
+import numpy as np
+
+from bee_tsp.core import _kernels
+from bee_tsp.core.utils import read_tsplib
+
+# Largest instance for which the full n×n int32 matrix is built (64 MB at the
+# limit). Building it also holds one n×n float64 work array (128 MB), two for
+# non-integer coordinates, so the peak at the limit is ~192-256 MB.
+MATRIX_MAX_N = 4000
+
+# Bytes of built matrices kept alive per process. Past this the least recently
+# built are released (rebuilt on next access), so the load_distance cache
+# cannot pin a matrix per entry.
+MATRIX_CACHE_BYTES = 256 << 20
+
+# id(Distance) -> weakref, oldest build first
+_built_matrices: "OrderedDict[int, weakref.ref]" = OrderedDict()
+
+# Edge lengths use sqrt(dx*dx + dy*dy) rather than hypot: TSPLIB coordinates
+# (|x| <= ~1e7) cannot overflow float64 when squared, the plain form is what
+# LKH computes, and it vectorizes to straight mul/add/sqrt instructions.
 
 @dataclass(frozen=True)
 class Distance:
     metric: str
-    coords: Tuple[Coord, ...]
+    coords: np.ndarray
     
     def __post_init__(self):
         if self.metric not in {"EUC_2D", "CEIL_2D", "ATT", "GEO"}:
             raise ValueError(f"Unsupported metric: {self.metric}")
-        object.__setattr__(self, 'coords', tuple(self.coords))
-        object.__setattr__(self, 'n', len(self.coords))
+        # Read-only C-contiguous (n, 2) float64 array read by every scoring path
+        xy = np.array(self.coords, dtype=np.float64, order="C").reshape(-1, 2)
+        xy.setflags(write=False)
+        object.__setattr__(self, 'coords', xy)
+        object.__setattr__(self, 'n', len(xy))
+    
+    def __eq__(self, other):
+        if not isinstance(other, Distance):
+            return NotImplemented
+        return self.metric == other.metric and np.array_equal(self.coords, other.coords)
+    
+    def __hash__(self):
+        return self._hash
+    
+    @cached_property
+    def _hash(self) -> int:
+        """Hash over the raw coordinate bytes, computed on first use only."""
+        return hash((self.metric, self.coords.shape, self.coords.tobytes()))
     
     def _euc(self, i: int, j: int) -> int:
         """EUC_2D: round to nearest integer"""
-        x1, y1 = self.coords[i]
-        x2, y2 = self.coords[j]
-        return int(round(math.hypot(x1 - x2, y1 - y2)))
+        xy = self.coords
+        dx = xy[i, 0] - xy[j, 0]
+        dy = xy[i, 1] - xy[j, 1]
+        return int(round(math.sqrt(dx * dx + dy * dy)))
     
     def _ceil(self, i: int, j: int) -> int:
         """CEIL_2D: ceiling of Euclidean distance"""
-        x1, y1 = self.coords[i]
-        x2, y2 = self.coords[j]
-        return int(math.ceil(math.hypot(x1 - x2, y1 - y2)))
+        xy = self.coords
+        dx = xy[i, 0] - xy[j, 0]
+        dy = xy[i, 1] - xy[j, 1]
+        return int(math.ceil(math.sqrt(dx * dx + dy * dy)))
+    
+    def _round(self, dist: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Apply the metric's rounding rule to raw Euclidean distances."""
+        if self.metric == "CEIL_2D":
+            return np.ceil(dist, out=out)
+        return np.rint(dist, out=out)  # Default to EUC_2D
+    
+    @property
+    def matrix(self) -> Optional[np.ndarray]:
+        """
+        n×n int32 distance matrix, built on first access (None when
+        n > MATRIX_MAX_N). d() and tour_length(s) use it once built but never
+        build it themselves: call this outside timed code if a run batch-scores
+        enough tours to repay the O(n²) build.
+        """
+        if self.n > MATRIX_MAX_N:
+            return None
+        m = self.__dict__.get('_matrix')
+        if m is None:
+            d2 = self._squared_distances()
+            np.sqrt(d2, out=d2)
+            m = self._round(d2, out=d2).astype(np.int32)
+            object.__setattr__(self, '_matrix', m)
+            _retain_matrix(self)
+        return m
+    
+    def _squared_distances(self) -> np.ndarray:
+        """
+        n×n squared distances. Integer coordinates use the GEMM expansion
+        |p|² + |q|² - 2p·q, exact in float64 once shifted by an integer centre;
+        anything else keeps the cancellation-free difference form.
+        """
+        xy = self.coords
+        centred = xy - np.rint(xy.mean(axis=0))
+        if np.array_equal(centred, np.rint(centred)) and np.abs(centred).max(initial=0) < 2**25:
+            sq = np.einsum('ij,ij->i', centred, centred)
+            d2 = centred @ centred.T
+            d2 *= -2.0
+            d2 += sq[:, None]
+            d2 += sq[None, :]
+            return d2
+        dx = xy[:, None, 0] - xy[None, :, 0]
+        dy = xy[:, None, 1] - xy[None, :, 1]
+        dx *= dx
+        dy *= dy
+        dx += dy
+        return dx
     
     def d(self, i: int, j: int) -> int:
         """Dispatch based on metric"""
         if i == j: 
             return 0
+        m = self.__dict__.get('_matrix')  # Only if already built
+        if m is not None:
+            return int(m[i, j])
         if self.metric == "CEIL_2D":
             return self._ceil(i, j)
         else:  # Default to EUC_2D
             return self._euc(i, j)
     
     def tour_length(self, tour: List[int]) -> int:
-        return sum(self.d(tour[i], tour[(i+1) % self.n]) for i in range(self.n))
+        """Closed tour length, all n edges scored in one vectorized pass."""
+        return int(self.tour_lengths(np.asarray(tour)[None, :])[0])
+    
+    def tour_lengths(self, tours: np.ndarray) -> np.ndarray:
+        """Closed lengths of a (k, n) batch of tours, one int64 per row."""
+        t = np.asarray(tours, dtype=np.intp)
+        succ = np.concatenate((t[:, 1:], t[:, :1]), axis=1)
+        m = self.__dict__.get('_matrix')  # Only if already built
+        if m is not None:
+            return m[t, succ].sum(axis=1, dtype=np.int64)
+        if _kernels.NUMBA_AVAILABLE:
+            kernel = _kernels.tour_length_ceil if self.metric == "CEIL_2D" else _kernels.tour_length_euc
+            return np.array([kernel(self.coords, row) for row in t], dtype=np.int64)
+        p = self.coords[t]
+        q = self.coords[succ]
+        dx = p[..., 0] - q[..., 0]
+        dy = p[..., 1] - q[..., 1]
+        edges = np.sqrt(dx * dx + dy * dy)
+        return self._round(edges).astype(np.int64).sum(axis=1)
+    
+    @classmethod
+    def from_parsed(cls, header: Dict[str, str], coords: np.ndarray):
+        """Build from already-parsed TSPLIB data (see read_tsplib)."""
+        metric = header.get("EDGE_WEIGHT_TYPE", "EUC_2D")  # Default
+        return cls(metric=metric, coords=coords)
     
     @classmethod
     def from_tsplib_file(cls, path: Path):
         """Auto-detect metric from TSPLIB file"""
-        metric = "EUC_2D"  # Default
-        coords = []
-        
-        with open(path) as f:
-            in_section = False
-            for line in f:
-                line_upper = line.strip().upper()
-                if line_upper.startswith("EDGE_WEIGHT_TYPE"):
-                    metric = line.split(":")[1].strip()
-                if line_upper == "NODE_COORD_SECTION":
-                    in_section = True
-                    continue
-                if line_upper == "EOF":
-                    break
-                if in_section:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        coords.append((float(parts[1]), float(parts[2])))
-        
-        return cls(metric=metric, coords=coords)
\ No newline at end of file
+        return cls.from_parsed(*read_tsplib(path))
+
+
+def _retain_matrix(dist: Distance) -> None:
+    """Record a newly built matrix; release the oldest past MATRIX_CACHE_BYTES."""
+    _built_matrices[id(dist)] = weakref.ref(dist)
+    total = 0
+    for key, ref in reversed(list(_built_matrices.items())):
+        owner = ref()
+        m = owner.__dict__.get('_matrix') if owner is not None else None
+        if m is None:
+            del _built_matrices[key]
+            continue
+        total += m.nbytes
+        if total > MATRIX_CACHE_BYTES and owner is not dist:
+            del owner.__dict__['_matrix']
+            del _built_matrices[key]
+
+
+# Parsed coordinates only (n×16 bytes each); matrices are bounded separately
+@lru_cache(maxsize=32)
+def _load_distance(path_str: str, mtime_ns: int) -> Distance:
+    return Distance.from_tsplib_file(Path(path_str))
+
+
+def load_distance(path: Path) -> Distance:
+    """
+    Distance for a TSPLIB file, shared across seeds.
+    Keyed by (path, mtime) so an edited instance is re-parsed.
+    """
+    path = Path(path)
+    return _load_distance(str(path), path.stat().st_mtime_ns)
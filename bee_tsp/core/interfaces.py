@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 from typing import List, Tuple
 from pathlib import Path
 
+import numpy as np
+
 from bee_tsp.core.distance import Distance
 
 
@@ -20,8 +22,12 @@ class Tour(List[int]):
     
     @staticmethod
     def _is_valid(tour: List[int]) -> bool:
-        n = len(tour)
-        return len(set(tour)) == n and min(tour) == 0 and max(tour) == n - 1
+        a = np.asarray(tour)
+        n = a.size
+        if n == 0 or a.min() != 0 or a.max() != n - 1:
+            return False
+        # Values lie in 0..n-1, so no bin above 1 means no duplicates
+        return bool(np.bincount(a, minlength=n).max() == 1)
 
 
 class Integrator(ABC):
@@ -1,27 +1,71 @@
 # In bee_tsp/core/utils.py
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, IO, List, Tuple
+import json
 
-def parse_tsplib_coords(path: Path) -> List[tuple[float, float]]:
-    """Minimal TSPLIB parser."""
-    coords = []
-    in_section = False
-        
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to stdlib json
+    orjson = None
+
+def read_tsplib(path: Path) -> Tuple[Dict[str, str], np.ndarray]:
+    """
+    Parse TSPLIB header fields and the NODE_COORD_SECTION block.
+    Header lines are scanned in Python; the coordinate block is handed to
+    np.loadtxt in one call. Returns (header, coords) with coords as (n, 2) float64.
+    """
+    header = {}
     with open(path, 'r', encoding='utf-8') as f:
         for line in f:
             line = line.strip()
-            if line == "NODE_COORD_SECTION":
-                in_section = True
-                continue
-            if line == "EOF":
+            if line.upper() == "NODE_COORD_SECTION":
                 break
-            if in_section:
-                parts = line.split()
-                if len(parts) >= 3:
-                    coords.append((float(parts[1]), float(parts[2])))
+            if line.upper() == "EOF":
+                return header, np.empty((0, 2), dtype=np.float64)
+            if ":" in line:
+                key, value = line.split(":", 1)
+                header[key.strip().upper()] = value.strip()
+        else:
+            return header, np.empty((0, 2), dtype=np.float64)
         
-    return coords
+        dim = header.get("DIMENSION")
+        coords = np.loadtxt(
+            f,
+            dtype=np.float64,
+            usecols=(1, 2),
+            max_rows=int(dim) if dim else None,
+            comments="EOF",
+            ndmin=2,
+        )
+    
+    return header, coords
+
+def json_line(row: Dict[str, Any]) -> bytes:
+    """Encode one JSONL record (newline included); orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(row, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(row) + "\n").encode()
+
+
+# "type" of the environment record written once at the top of an audit JSONL
+MACHINE_INFO_RECORD = "machine_info"
+
+def read_jsonl_header(f: IO[str]) -> Dict[str, Any]:
+    """
+    Consume the machine_info header record of an audit JSONL, if present.
+    Leaves f at the first run row and returns the header ({} and f rewound
+    for files without one, e.g. older runs).
+    """
+    first = f.readline()
+    record = json.loads(first) if first.strip() else None
+    if isinstance(record, dict) and record.get("type") == MACHINE_INFO_RECORD:
+        return record
+    f.seek(0)
+    return {}
+
 
 @dataclass(frozen=True)
 class ERDiagnostics:
@@ -5,8 +5,8 @@ Generates random tours for comparison with LKH.
 """
 
 from __future__ import annotations
+import logging
 import time
-import random
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Tuple, Dict, Any
@@ -14,9 +14,11 @@ from typing import List, Tuple, Dict, Any
 import numpy as np
 
 from bee_tsp.core.interfaces import Integrator, Tour
-from bee_tsp.core.distance import Distance
+from bee_tsp.core.distance import load_distance
 from bee_tsp.core.solver_config import RepairConfig
-from bee_tsp.core.utils import parse_tsplib_coords, ERDiagnostics
+from bee_tsp.core.utils import ERDiagnostics
+
+logger = logging.getLogger(__name__)
 
 class EdgeRandIntegrator(Integrator):
     """
@@ -27,7 +29,7 @@ class EdgeRandIntegrator(Integrator):
     def __init__(self, repair_cfg: RepairConfig):
         self.repair_cfg = repair_cfg
         self._last_diagnostics: ERDiagnostics | None = None
-        print(f"[EdgeRand] Initialised")
+        logger.debug("Initialised")
     
     def solve(
         self, 
@@ -39,42 +41,59 @@ class EdgeRandIntegrator(Integrator):
         """
         Generate a random tour.
         """
+        return self.solve_batch(instance_path, max_time_s, [seed], candidate_k)[0]
+    
+    def solve_batch(
+        self,
+        instance_path: Path,
+        max_time_s: float,
+        seeds: List[int],
+        candidate_k: int,
+    ) -> List[Tuple[Tour, List[Tuple[float, int]]]]:
+        """
+        Generate one random tour per seed and score them all in one pass.
+        Each seed drives its own Generator, so a seed's tour does not depend
+        on which other seeds share the batch (paired seeds stay paired).
+        Trace times are the batch wall time amortised per seed.
+        """
         start = time.monotonic()
         
-        # Load coordinates to get n cities
-        coords = parse_tsplib_coords(instance_path)
-        n = len(coords)
+        # Parsed once per instance and shared across seeds
+        dist = load_distance(instance_path)
+        n = dist.n
 
-        print(f"File: {instance_path.name}")
-        print(f"Cities: {n}")
-        print(f"Coordinate range: X({min(c[0] for c in coords):.0f}-{max(c[0] for c in coords):.0f}) Y({min(c[1] for c in coords):.0f}-{max(c[1] for c in coords):.0f})")
+        if logger.isEnabledFor(logging.DEBUG):
+            lo, hi = dist.coords.min(axis=0), dist.coords.max(axis=0)
+            logger.debug(
+                "File: %s | Cities: %d | Coordinate range: X(%.0f-%.0f) Y(%.0f-%.0f)",
+                instance_path.name, n, lo[0], hi[0], lo[1], hi[1],
+            )
         
-        # Generate random tour
-        rng = random.Random(seed)
-        tour = list(range(n))
-        rng.shuffle(tour)
+        # Generate random tours, one row per seed
+        perms = np.stack([np.random.default_rng(seed).permutation(n) for seed in seeds])
         
         # Validate
-        tour_obj = Tour(tour)
+        tours = [Tour(row) for row in perms.tolist()]
         
-        # Compute length
-        dist = Distance.from_tsplib_file(instance_path)
-        length = dist.tour_length(tour_obj)
+        # Compute lengths for the whole batch
+        lengths = dist.tour_lengths(perms).tolist()
         
-        elapsed = time.monotonic() - start
+        elapsed = (time.monotonic() - start) / len(seeds)
         
-        # Build trace
-        trace = [(elapsed, length)]
+        # Build traces
+        traces = [[(elapsed, length)] for length in lengths]
         
         # Store diagnostics
         self._last_diagnostics = ERDiagnostics(
-            runs_completed=1,
+            runs_completed=len(seeds),
             time_limit_reached=False,
-            trace=trace,
+            trace=[t[0] for t in traces],
         )
         # Debug: Verify tours are actually different
-        print(f"DEBUG: Seed {seed}, Tour hash: {hash(tuple(tour_obj[:5]))}, Length: {length}")
-        return tour_obj, trace
+        if logger.isEnabledFor(logging.DEBUG):
+            for seed, tour_obj, length in zip(seeds, tours, lengths):
+                logger.debug("Seed %d, Tour hash: %d, Length: %d", seed, hash(tuple(tour_obj[:5])), length)
+        return list(zip(tours, traces))
     
     def get_last_run_diagnostics(self) -> Dict[str, Any]:
         """Return diagnostics."""
@@ -4,17 +4,26 @@ LKHIntegrator: Direct LKH binary wrapper.
 Handles all edge types and supports full time limits.
 """
 
+import logging
 from pathlib import Path
 from typing import Tuple, List, Optional
 import time
 import subprocess
 import tempfile
 import re
+
+import numpy as np
+
 from bee_tsp.core.interfaces import Integrator, Tour
 from bee_tsp.core.solver_config import RepairConfig
-from bee_tsp.core.distance import Distance
+from bee_tsp.core.distance import load_distance
 from bee_tsp.core.utils import ERDiagnostics
 
+logger = logging.getLogger(__name__)
+
+# Where LKHIntegrator looks for the LKH-3 executable unless told otherwise
+DEFAULT_LKH_BINARY = Path("~/bin/LKH").expanduser()
+
 class LKHIntegrator(Integrator):
     """
     Lin-Kernighan Heuristic (LKH) integrator using LKH-3 binary.
@@ -23,7 +32,7 @@ class LKHIntegrator(Integrator):
     def __init__(
         self,
         repair_cfg: RepairConfig,
-        lkh_binary: Path = Path("~/bin/LKH").expanduser(),
+        lkh_binary: Path = DEFAULT_LKH_BINARY,
     ):
         self.repair_cfg = repair_cfg
         self.lkh_binary = lkh_binary
@@ -35,7 +44,7 @@ class LKHIntegrator(Integrator):
                 "Download from: http://webhotel4.ruc.dk/~keld/research/LKH-3/"
             )
         
-        print(f"[LKH] Initialised | Binary: {self.lkh_binary}")
+        logger.debug("Initialised | Binary: %s", self.lkh_binary)
     
     def solve(
         self,
@@ -59,17 +68,18 @@ class LKHIntegrator(Integrator):
                 par_file, instance_path, tour_file, max_time_s, seed
             )
             
-            # Execute LKH
+            # Execute LKH (tour is read from tour_file, so stdout is discarded)
             try:
                 result = subprocess.run(
                     [str(self.lkh_binary), str(par_file)],
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     timeout=max_time_s + 10.0  # Grace period
                 )
                 
                 if result.returncode != 0:
-                    raise RuntimeError(f"LKH failed: {result.stderr}")
+                    stderr = result.stderr.decode(errors="replace")
+                    raise RuntimeError(f"LKH failed: {stderr}")
                     
             except subprocess.TimeoutExpired:
                 raise RuntimeError(f"LKH timed out after {max_time_s + 10.0}s")
@@ -82,7 +92,7 @@ class LKHIntegrator(Integrator):
         
         # Validate and compute length
         tour_obj = Tour(tour_list)
-        dist = Distance.from_tsplib_file(instance_path)
+        dist = load_distance(instance_path)
         length = dist.tour_length(tour_obj)
         
         elapsed = time.monotonic() - start
@@ -120,30 +130,27 @@ SEED = {lkh_seed}
 CANDIDATE_SET_TYPE = POPMUSIC
 MAX_CANDIDATES = 8
 INITIAL_PERIOD = 100
-TRACE_LEVEL = 1
+TRACE_LEVEL = 0
 """
         par_file.write_text(content)
     
     def _parse_tour_file(self, tour_file: Path) -> List[int]:
         """Parse LKH tour file (1-based) → 0-based list."""
-        tour = []
-        in_section = False
+        text = tour_file.read_text()
+        start = text.find("TOUR_SECTION")
+        if start < 0:
+            return []
+        start += len("TOUR_SECTION")
         
-        for line in tour_file.read_text().splitlines():
-            if line.startswith("TOUR_SECTION"):
-                in_section = True
-                continue
-            if line.startswith("-1"):
-                break
-            if in_section and line.strip():
-                node = int(line.strip()) - 1  # Convert to 0-based
-                tour.append(node)
+        # Node block ends at the -1 terminator (or EOF if LKH omitted it)
+        end = text.find("-1", start)
+        if end < 0:
+            end = text.find("EOF", start)
+        block = text[start:end] if end >= 0 else text[start:]
         
-        return tour
-    
-    def _check_time_limit_reached(self, stdout: str) -> bool:
-        """Check if LKH hit its time limit."""
-        return "Time limit exceeded" in stdout
+        # One C-level scan over whitespace-separated node ids
+        tour = np.fromstring(block, dtype=np.int64, sep=" ")
+        return (tour - 1).tolist()  # Convert to 0-based
     
     def get_last_run_diagnostics(self) -> Optional[ERDiagnostics]:
         return self._last_diagnostics
\ No newline at end of file
@@ -7,6 +7,7 @@ Fast, robust scoring based on config + JSONL results.
 import json
 import pandas as pd
 from pathlib import Path
+from bee_tsp.core.utils import read_jsonl_header
 
 def audit():
     """Score based on config and first JSONL row."""
@@ -42,7 +43,11 @@ def audit():
         return
     
     with open(jsonl_files[0]) as f:
+        machine_info = read_jsonl_header(f)
         row = json.loads(f.readline())
+    # Newer runs record machine info once in the header instead of per row
+    if machine_info:
+        row.setdefault("machine_info", machine_info)
 
     # 4. Johnson Principles
     # Principle 1: Newsworthy (n≥10 seeds)
@@ -6,6 +6,7 @@ Principle 8: Generate boxplots of performance vs. instance size.
 import pandas as pd
 import matplotlib.pyplot as plt
 from pathlib import Path
+from bee_tsp.core.utils import read_jsonl_header
 
 def generate_plots(jsonl_path: Path = None):
     """Generate Figure 1: Performance comparison plot."""
@@ -26,15 +27,12 @@ def generate_plots(jsonl_path: Path = None):
     if jsonl_path.stat().st_size == 0:
         raise ValueError(f"File is empty: {jsonl_path}")
     
-    # Load with proper StringIO wrapper to avoid FutureWarning
-    import io
+    # Pass the file itself: pandas streams it, and only literal JSON strings
+    # (not paths or handles) trigger the FutureWarning. The machine_info
+    # header record is skipped first.
     with open(jsonl_path) as f:
-        content = f.read()
-    
-    if not content.strip():
-        raise ValueError("JSONL file has no content")
-    
-    df = pd.read_json(io.StringIO(content), lines=True)
+        read_jsonl_header(f)
+        df = pd.read_json(f, lines=True, precise_float=True)
     
     # Verify expected columns exist
     required_cols = ["instance", "integrator", "budget_s", "best_length", "hk_bound"]
@@ -1,22 +1,27 @@
 #!/usr/bin/env python3
 """
 Parallel titration protocol driver.
-Runs experiments across 6 workers (one per physical core).
+Runs experiments across worker processes (one per CPU core).
 """
 
 from __future__ import annotations
-import time, json, math
-from dataclasses import field
+import os, time, json, math, csv
+import itertools
+import multiprocessing, queue, sys, threading
+from dataclasses import field, fields
 from dataclasses import dataclass
-from typing import List, Tuple, Dict, Any
+from typing import TYPE_CHECKING, List, Tuple, Dict, Any, Iterator, Optional
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from bee_tsp.titration.config import TitrationConfig, RepairConfig
-from bee_tsp.core.distance import Distance
+from bee_tsp.core.distance import Distance, load_distance
 from bee_tsp.core.interfaces import Tour
+from bee_tsp.core.utils import json_line
 from bee_tsp.integrators.lkh_integrator import LKHIntegrator as LKHSolver
 
+if TYPE_CHECKING:
+    import pandas as pd  # Imported lazily: iter_runs() callers never need it
+
 @dataclass(frozen=True)
 class ProtocolResult:
     """One row = one run. Immutable, auditable."""
@@ -38,8 +43,62 @@ class ProtocolResult:
     cycles_explored: int = 0
     repair_path: str = ""
 
+# Columns of current_results.csv: one per ProtocolResult field, plus instance size
+RESULT_COLUMNS = [f.name for f in fields(ProtocolResult)] + ["n"]
+
+@dataclass(frozen=True)
+class InstanceInfo:
+    """Everything a run needs about its instance, resolved once up front."""
+    path: Path
+    optimal: int              # 0 = "not found"
+    hk_bound: Optional[int]   # None = "not computed"
+
+# Workers inherit the parent's load_distance cache only when forked, so ask
+# for fork explicitly where the platform has it (defaults differ by version)
+_MP_CONTEXT = (multiprocessing.get_context("fork")
+               if "fork" in multiprocessing.get_all_start_methods() else None)
+
+# Per-process experiment state, filled once by _init_worker
+_WORKER: Dict[str, Any] = {}
+
+
+def _build_integrators() -> Dict[str, Any]:
+    """Factory: only LKH for now."""
+    repair_cfg = RepairConfig(time_ms=1000)  # Dummy for LKH
+        
+    return {
+        "lkh": LKHSolver(repair_cfg=repair_cfg),
+    }
+
+
+def _init_worker(
+    cfg: TitrationConfig,
+    machine_info: Dict[str, Any],
+    instances: Dict[str, InstanceInfo],
+) -> None:
+    """ProcessPoolExecutor initializer: shared inputs and solvers, once per worker."""
+    _WORKER.update(
+        cfg=cfg,
+        machine_info=machine_info,
+        instances=instances,
+        integrators=_build_integrators(),
+    )
+
+
+def _drain_log(log_q: "queue.Queue[Optional[str]]") -> None:
+    """Write queued progress lines to stdout until a None sentinel arrives."""
+    while True:
+        line = log_q.get()
+        if line is None:
+            break
+        sys.stdout.write(line)
+        if log_q.empty():
+            sys.stdout.flush()  # Flush per burst, not per line
+    sys.stdout.flush()
+
+
 class TitrationProtocol:
-    """Execute experiments in parallel across 6 workers."""
+    """Execute experiments in parallel across worker processes."""
     
     def __init__(self, cfg: TitrationConfig):
         self.cfg = cfg
@@ -53,14 +112,40 @@ class TitrationProtocol:
         with open("data/hk_bounds.json") as f:
             self.hk_bounds = json.load(f)
         
-        # Initialize integrators
-        self.integrators = self._build_integrators()
+        # Initialize integrators (fails fast on a missing LKH binary;
+        # worker processes build their own copies)
+        self.integrators = _build_integrators()
         
         # Load optimal values (fallback)
         self.optimal_lengths = self._load_optimal_lengths()
         
+        # Path, optimal and HK bound per instance ONCE: one lookup per experiment
+        self._instances = {
+            inst: InstanceInfo(
+                path=self.cfg.tsplib_dir / f"{inst}.tsp",
+                optimal=self.optimal_lengths.get(inst, 0),
+                hk_bound=self.hk_bounds.get(inst, None),
+            )
+            for inst in self.cfg.instances
+        }
+        
+        # Parse each instance ONCE into the load_distance cache; workers are
+        # forked (_MP_CONTEXT), so seed replicates never re-read the file
+        for inst, info in self._instances.items():
+            try:
+                load_distance(info.path)
+            except Exception as e:
+                # Runs still execute and record the error; say why up front
+                print(f"[PROTOCOL] Warning: could not load {inst} ({info.path}): {e}")
+        
+        # Instance sizes ONCE (instances are fixed by cfg)
+        self._instance_meta_cache = self._instance_metadata()
+        
         # Results accumulator
         self.results: List[ProtocolResult] = []
+        
+        # Row dicts of self.results (the same dicts written to the JSONL), filled by run()
+        self.rows: List[Dict[str, Any]] = []
     
     def _validate_cfg(self):
         """Fail fast on invalid config."""
@@ -74,18 +159,8 @@ class TitrationProtocol:
     
     def _get_hk_bound(self, instance: str) -> int:
         """Return HK bound for instance (uses optimal as approximation)."""
-        with open("data/hk_bounds.json") as f:
-            bounds = json.load(f)
-        return bounds.get(instance, 0)  # Returns 0 if not found (will error)
+        return self.hk_bounds.get(instance, 0)  # Returns 0 if not found (will error)
         
-    def _build_integrators(self) -> Dict[str, Any]:
-        """Factory: only LKH for now."""
-        repair_cfg = RepairConfig(time_ms=1000)  # Dummy for LKH
-            
-        return {
-            "lkh": LKHSolver(repair_cfg=repair_cfg),
-        }
-    
     def _load_optimal_lengths(self) -> Dict[str, int]:
         """Load optimal tour lengths from data/optimal_values.csv."""
         optimal_path = Path("data/optimal_values.csv")
@@ -98,168 +173,117 @@ class TitrationProtocol:
                 "kroA100": 21282,
             }
         
-        df = pd.read_csv(optimal_path)
-        return dict(zip(df["instance"], df["optimal_length"]))
+        with open(optimal_path, newline="") as f:
+            return {row["instance"]: int(row["optimal_length"]) for row in csv.DictReader(f)}
     
     def run(self) -> pd.DataFrame:
         """Run full factorial design in parallel."""
-        total_runs = (len(self.cfg.instances) * 
-                    len(self.cfg.integrators) * 
-                    len(self.cfg.budgets) * 
-                    len(self.cfg.seeds))
-        
-        print(f"[PROTOCOL] Running {total_runs} experiments across 6 workers")
-        
-        # Generate all experiment tuples
-        experiments = []
-        for instance in self.cfg.instances:
-            for integrator_name in self.cfg.integrators:
-                for budget in self.cfg.budgets:
-                    for seed in self.cfg.seeds:
-                        experiments.append((instance, integrator_name, budget, seed))
-        
-        # Run in parallel (6 workers = 6 physical cores)
-        with ThreadPoolExecutor(max_workers=6) as executor:
-            futures = {
-                executor.submit(self._run_single, exp): exp 
-                for exp in experiments
-            }
-            
-            for future in as_completed(futures):
-                result = future.result()
-                self.results.append(result)
-                print(f"[DONE] {result.instance} | {result.integrator} | "
-                    f"budget={result.budget_s:.0f}s | seed={result.seed} | "
-                    f"cost=${result.compute_cost_usd:.4f}")
+        for result, row in self._iter_saved_rows():
+            self.results.append(result)
+            self.rows.append(row)
         
-        # Finalize results into DataFrame
-        df = self._finalize_results()
-        
-        # SAVE TO DISK (add this block)
+        # Finalize results into DataFrame (audit files are already on disk)
+        return self._finalize_results()
+    
+    def iter_runs(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one row dict per finished run (completion order, same columns as
+        run()'s DataFrame, including n). Rows are not kept, so callers can
+        stream them to disk; the audit files are written exactly as run() writes them.
+        """
+        for result, row in self._iter_saved_rows():
+            yield dict(row, n=self._instance_meta_cache.get(result.instance))
+    
+    def _iter_saved_rows(self) -> Iterator[Tuple[ProtocolResult, Dict[str, Any]]]:
+        """
+        Run every experiment, appending each finished row to the audit files
+        as it arrives (a crash keeps every finished run). Yields the result
+        and its row dict (the exact dict encoded into the JSONL).
+        """
         results_dir = Path("results")
         results_dir.mkdir(exist_ok=True)
         
         # JSONL: one row per line (Johnson-compliant audit trail)
         jsonl_path = results_dir / "minimal_audit.jsonl"
-        with open(jsonl_path, "w") as f:
-            for result in self.results:
-                f.write(json.dumps(result.__dict__) + "\n")
-        
         # CSV: for JohnsonAuditor compatibility
-        df.to_csv(results_dir / "current_results.csv", index=False)
+        csv_path = results_dir / "current_results.csv"
         
-        print(f"[PROTOCOL] Saved {len(df)} rows to {jsonl_path}")
+        saved = 0
+        with open(jsonl_path, "wb", buffering=1 << 20) as jsonl_file, \
+                open(csv_path, "w", newline="", buffering=1 << 20) as csv_file:
+            csv_writer = csv.DictWriter(csv_file, fieldnames=RESULT_COLUMNS, lineterminator="\n")
+            csv_writer.writeheader()
+            for result in self._iter_results():
+                row = result.__dict__
+                jsonl_file.write(json_line(row))
+                csv_writer.writerow(dict(row, n=self._instance_meta_cache.get(result.instance)))
+                saved += 1
+                yield result, row
         
-        # NOW return the DataFrame
-        return df
+        print(f"[PROTOCOL] Saved {saved} rows to {jsonl_path}")
     
-    def _run_single(self, exp: Tuple) -> ProtocolResult:
-        instance, integrator_name, budget, seed = exp
-        
-        solver = self.integrators[integrator_name]
-        optimal = self.optimal_lengths.get(instance, 0) # 0 = "not found"
+    def _iter_results(self) -> Iterator[ProtocolResult]:
+        """Run every experiment across worker processes, yielding results as they finish."""
+        total_runs = (len(self.cfg.instances) * 
+                    len(self.cfg.integrators) * 
+                    len(self.cfg.budgets) * 
+                    len(self.cfg.seeds))
         
-        # Get HK bound (pre-loaded in __init__)
-        hk_bound = self.hk_bounds.get(instance, None)  #  None = "not computed"
+        workers = os.cpu_count() or 1
+        print(f"[PROTOCOL] Running {total_runs} experiments across {workers} workers")
         
-        # Use HK for gap if available, otherwise optimal, otherwise fail
-        gap_denominator = hk_bound if hk_bound is not None else optimal
-        if gap_denominator <= 0:
-            gap_denominator = 1  # Prevent division by zero
+        # All experiment tuples, generated lazily as they are submitted
+        experiments = itertools.product(
+            self.cfg.instances, self.cfg.integrators, self.cfg.budgets, self.cfg.seeds
+        )
         
-        deviations = []
-        if hk_bound is None:
-            deviations.append(f"HK bound not computed; using optimal = {optimal}")
-        if optimal == 0:
-            deviations.append(f"Optimal length missing; gap calculation invalid")
+        # Progress lines go to a writer thread so collection never waits on stdout
+        log_q: "queue.Queue[Optional[str]]" = queue.Queue()
+        writer = threading.Thread(target=_drain_log, args=(log_q,), daemon=True)
         
+        # Run in parallel (one process per core, so Python-side work is not GIL-bound)
         try:
-            tour, trace = solver.solve(
-                instance_path=self.cfg.tsplib_dir / f"{instance}.tsp",
-                max_time_s=budget,
-                seed=seed,
-                candidate_k=self.cfg.candidate_k,
-            )
-            
-            length = trace[0][1] if trace else -1
-            elapsed = trace[0][0] if trace else budget
-            
-            # CORRECT gap calculation
-            gap = (length - gap_denominator) / gap_denominator * 100
-            
-            # SAFE diagnostics extraction
-            try:
-                diagnostics = solver.get_last_run_diagnostics()
-                # Handle both dict-like and object-like diagnostics
-                if hasattr(diagnostics, 'get'):
-                    cycles = diagnostics.get("cycles_explored", 0)
-                    repair = diagnostics.get("repair_path", "lkh")
-                else:
-                    # Object with attributes
-                    cycles = getattr(diagnostics, 'cycles_explored', 0)
-                    repair = getattr(diagnostics, 'repair_path', 'lkh')
-            except Exception:
-                cycles = 0
-                repair = "lkh"
-            
-            # Compute cost
-            cost_usd = elapsed * self.cfg.aws_hourly_rate / 3600
-            
-            return ProtocolResult(
-                instance=instance,
-                integrator=integrator_name,
-                budget_s=budget,
-                seed=seed,
-                best_length=length,
-                time_to_best_s=elapsed,
-                final_gap_pct=gap,
-                hk_bound=hk_bound or optimal,
-                wall_time_s=elapsed,
-                compute_cost_usd=cost_usd,
-                raw_trace=trace,
-                cycles_explored=cycles,
-                repair_path=repair,
-                machine_info=self.machine_info,
-                deviations=deviations,
-            )
-
-        except Exception as e:
-            # Graceful failure with ALL required fields
-            cost_usd = budget * self.cfg.aws_hourly_rate / 3600
-            hk_bound = self.hk_bounds.get(instance, 0)
-            
-            return ProtocolResult(
-                instance=instance,
-                integrator=integrator_name,
-                budget_s=budget,
-                seed=seed,
-                best_length=-1,
-                time_to_best_s=budget,
-                final_gap_pct=-1.0,
-                hk_bound=hk_bound,
-                wall_time_s=budget,
-                compute_cost_usd=cost_usd,
-                raw_trace=[],
-                cycles_explored=0,
-                repair_path=f"ERROR: {e}",
-                machine_info=getattr(self, 'machine_info', {}),
-                deviations=deviations + [f"Runtime error: {str(e)}"],
-            )
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=_MP_CONTEXT,
+                initializer=_init_worker,
+                initargs=(self.cfg, self.machine_info, self._instances),
+            ) as executor:
+                futures = {
+                    executor.submit(_run_single, exp): exp 
+                    for exp in experiments
+                }
+                # Forked workers all start on the first submit; start the
+                # writer only now so no thread of ours is running at fork time
+                writer.start()
+                
+                for future in as_completed(futures):
+                    result = future.result()
+                    log_q.put_nowait(f"[DONE] {result.instance} | {result.integrator} | "
+                        f"budget={result.budget_s:.0f}s | seed={result.seed} | "
+                        f"cost=${result.compute_cost_usd:.4f}\n")
+                    yield result
+        finally:
+            if writer.is_alive():
+                log_q.put(None)
+                writer.join()
     
     def _finalize_results(self) -> pd.DataFrame:
-        """Convert results to DataFrame."""
-        df = pd.DataFrame([r.__dict__ for r in self.results])
-        df["n"] = df["instance"].map(self._instance_metadata())
+        """Convert results to DataFrame (reuses the row dicts already written to the JSONL)."""
+        import pandas as pd
+        
+        df = pd.DataFrame(self.rows)
+        df["n"] = df["instance"].map(self._instance_meta_cache)
         return df
     
     def _instance_metadata(self) -> Dict[str, int]:
-        """Extract instance sizes."""
+        """Extract instance sizes (DIMENSION sits in the first few header lines)."""
         metadata = {}
         for inst in self.cfg.instances:
             path = self.cfg.tsplib_dir / f"{inst}.tsp"
             try:
                 with open(path) as f:
-                    for line in f:
+                    for line in itertools.islice(f, 20):
                         if line.startswith("DIMENSION"):
                             n = int(line.split(":")[1].strip())
                             metadata[inst] = n
@@ -269,6 +293,107 @@ class TitrationProtocol:
         return metadata
 
 
+def _run_single(exp: Tuple) -> ProtocolResult:
+    """
+    Run one experiment in a worker. Top-level (not a method) so it pickles
+    into ProcessPoolExecutor; everything else comes from _init_worker.
+    """
+    instance, integrator_name, budget, seed = exp
+    cfg = _WORKER["cfg"]
+    machine_info = _WORKER["machine_info"]
+    
+    info = _WORKER["instances"][instance]
+    
+    solver = _WORKER["integrators"][integrator_name]
+    optimal = info.optimal # 0 = "not found"
+    
+    # Get HK bound (pre-loaded in TitrationProtocol.__init__)
+    hk_bound = info.hk_bound  #  None = "not computed"
+    
+    # Use HK for gap if available, otherwise optimal, otherwise fail
+    gap_denominator = hk_bound if hk_bound is not None else optimal
+    if gap_denominator <= 0:
+        gap_denominator = 1  # Prevent division by zero
+    
+    deviations = []
+    if hk_bound is None:
+        deviations.append(f"HK bound not computed; using optimal = {optimal}")
+    if optimal == 0:
+        deviations.append(f"Optimal length missing; gap calculation invalid")
+    
+    try:
+        tour, trace = solver.solve(
+            instance_path=info.path,
+            max_time_s=budget,
+            seed=seed,
+            candidate_k=cfg.candidate_k,
+        )
+    
+        length = trace[0][1] if trace else -1
+        elapsed = trace[0][0] if trace else budget
+    
+        # CORRECT gap calculation
+        gap = (length - gap_denominator) / gap_denominator * 100
+    
+        # SAFE diagnostics extraction
+        try:
+            diagnostics = solver.get_last_run_diagnostics()
+            # Handle both dict-like and object-like diagnostics
+            if hasattr(diagnostics, 'get'):
+                cycles = diagnostics.get("cycles_explored", 0)
+                repair = diagnostics.get("repair_path", "lkh")
+            else:
+                # Object with attributes
+                cycles = getattr(diagnostics, 'cycles_explored', 0)
+                repair = getattr(diagnostics, 'repair_path', 'lkh')
+        except Exception:
+            cycles = 0
+            repair = "lkh"
+    
+        # Compute cost
+        cost_usd = elapsed * cfg.aws_hourly_rate / 3600
+    
+        return ProtocolResult(
+            instance=instance,
+            integrator=integrator_name,
+            budget_s=budget,
+            seed=seed,
+            best_length=length,
+            time_to_best_s=elapsed,
+            final_gap_pct=gap,
+            hk_bound=hk_bound or optimal,
+            wall_time_s=elapsed,
+            compute_cost_usd=cost_usd,
+            raw_trace=trace,
+            cycles_explored=cycles,
+            repair_path=repair,
+            machine_info=machine_info,
+            deviations=deviations,
+        )
+    
+    except Exception as e:
+        # Graceful failure with ALL required fields
+        cost_usd = budget * cfg.aws_hourly_rate / 3600
+    
+        return ProtocolResult(
+            instance=instance,
+            integrator=integrator_name,
+            budget_s=budget,
+            seed=seed,
+            best_length=-1,
+            time_to_best_s=budget,
+            final_gap_pct=-1.0,
+            hk_bound=hk_bound or 0,
+            wall_time_s=budget,
+            compute_cost_usd=cost_usd,
+            raw_trace=[],
+            cycles_explored=0,
+            repair_path=f"ERROR: {e}",
+            machine_info=machine_info,
+            deviations=deviations + [f"Runtime error: {str(e)}"],
+        )
+
+
 def test_protocol():
     """Smoke test: run protocol on tiny config."""
     from bee_tsp.titration.config import TitrationConfig
@@ -6,11 +6,11 @@ Enforces n≥30, p<0.001, effect size >0.1.
 
 import numpy as np
 import pandas as pd
-import json
 from scipy.stats import wilcoxon
 from dataclasses import dataclass
 from typing import Tuple, List
 from pathlib import Path
+from bee_tsp.core.utils import read_jsonl_header
 
 @dataclass(frozen=True)
 class StatisticalResult:
@@ -28,30 +28,30 @@ class StatisticalEnforcer:
     @staticmethod
     def cliffs_delta(x: List[float], y: List[float]) -> float:
         """Non-parametric effect size: [-1, 1], |δ|>0.1 is meaningful."""
-        n_x, n_y = len(x), len(y)
-        n_dominant = 0
+        x, y_sorted = np.asarray(x), np.sort(np.asarray(y))
+        n_x, n_y = len(x), len(y_sorted)
         
-        for xi in x:
-            for yi in y:
-                if xi < yi:
-                    n_dominant += 1
-                elif xi > yi:
-                    n_dominant -= 1
+        # Pair counts via binary search on sorted y: O((n+m) log m), no n×m array.
+        # Already sub-quadratic, so a Numba pair-scan kernel would only be slower.
+        n_less = n_y * n_x - np.searchsorted(y_sorted, x, side="right").sum()  # xi < yj
+        n_greater = np.searchsorted(y_sorted, x, side="left").sum()            # xi > yj
+        n_dominant = int(n_less - n_greater)
         
         return n_dominant / (n_x * n_y)
     
     @staticmethod
     def bootstrap_ci(x: List[float], y: List[float], n_boot: int = 10000) -> Tuple[float, float]:
         """95% CI for mean difference using percentile bootstrap."""
-        x, y = np.array(x), np.array(y)
-        diffs = []
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        rng = np.random.default_rng()
         
-        for _ in range(n_boot):
-            x_boot = np.random.choice(x, size=len(x), replace=True)
-            y_boot = np.random.choice(y, size=len(y), replace=True)
-            diffs.append(np.mean(x_boot) - np.mean(y_boot))
+        # All resamples drawn as (n_boot, n) index matrices, means reduced along axis 1
+        x_boot = x[rng.integers(0, len(x), size=(n_boot, len(x)))].mean(axis=1)
+        y_boot = y[rng.integers(0, len(y), size=(n_boot, len(y)))].mean(axis=1)
+        diffs = x_boot - y_boot
         
-        return float(np.percentile(diffs, 2.5)), float(np.percentile(diffs, 97.5))
+        lower, upper = np.percentile(diffs, [2.5, 97.5])
+        return float(lower), float(upper)
     
     @staticmethod
     def paired_comparison(
@@ -121,15 +121,12 @@ class StatisticalEnforcer:
 def add_normalized_times(df: pd.DataFrame) -> pd.DataFrame:
     """Add wall_time_s / (n * log(n)) column for Principle 10."""
     
-    # Extract node count from instance name (eil51 -> 51, dsj1000 -> 1000)
-    def extract_n(instance_name: str) -> int:
-        """Extract node count from instance name."""
-        import re
-        match = re.search(r'(\d+)$', instance_name)
-        return int(match.group(1)) if match else 50
+    # Extract node count from instance name (eil51 -> 51, dsj1000 -> 1000), default 50
+    n = df["instance"].str.extract(r'(\d+)$', expand=False).fillna("50").astype(np.int64)
     
-    df["n_nodes"] = df["instance"].apply(extract_n)
-    df["normalized_time"] = df["wall_time_s"] / (df["n_nodes"] * np.log(df["n_nodes"]))
+    df["n_nodes"] = n
+    n = n.to_numpy()
+    df["normalized_time"] = df["wall_time_s"].to_numpy() / (n * np.log(n))
     return df
 
 def analyze_results(jsonl_path: Path = None):
@@ -153,13 +150,11 @@ def analyze_results(jsonl_path: Path = None):
     if jsonl_path.stat().st_size == 0:
         raise ValueError(f"File is empty: {jsonl_path}")
     
-    # Load data
-    results = []
+    # Load data straight into a columnar frame (no intermediate list of dicts),
+    # skipping the machine_info header record
     with open(jsonl_path) as f:
-        for line in f:
-            results.append(json.loads(line))
-    
-    df = pd.DataFrame(results)
+        read_jsonl_header(f)
+        df = pd.read_json(f, lines=True, dtype=False, convert_dates=False, precise_float=True)
     
     # Verify required columns exist
     required_cols = ["instance", "integrator", "budget_s", "seed", "best_length", "wall_time_s"]
@@ -174,19 +169,26 @@ def analyze_results(jsonl_path: Path = None):
     # Group by instance and budget
     stats_results = []
     
-    for (instance, budget), group in df.groupby(["instance", "budget_s"]):
-        seeds_lkh = group[group["integrator"] == "lkh"]["best_length"].tolist()
-        seeds_er = group[group["integrator"] == "EdgeRand"]["best_length"].tolist()
+    # One row per (instance, budget, seed), one column per integrator: seeds pair up by row
+    paired = df.pivot_table(
+        index=["instance", "budget_s", "seed"],
+        columns="integrator",
+        values="best_length",
+        aggfunc="first",
+    )
+    if {"lkh", "EdgeRand"} <= set(paired.columns):
+        paired = paired[["lkh", "EdgeRand"]].dropna()
         
-        if len(seeds_lkh) == len(seeds_er) == 30:
-            stat = StatisticalEnforcer.paired_comparison(
-                lengths_a=seeds_lkh,
-                lengths_b=seeds_er,
-                instance=f"{instance}_lkh_vs_EdgeRand",
-                integrator_a=f"lkh_{budget}s",
-                integrator_b=f"EdgeRand_{budget}s"
-            )
-            stats_results.append(stat)
+        for (instance, budget), group in paired.groupby(level=["instance", "budget_s"]):
+            if len(group) == 30:
+                stat = StatisticalEnforcer.paired_comparison(
+                    lengths_a=group["lkh"].to_numpy(),
+                    lengths_b=group["EdgeRand"].to_numpy(),
+                    instance=f"{instance}_lkh_vs_EdgeRand",
+                    integrator_a=f"lkh_{budget}s",
+                    integrator_b=f"EdgeRand_{budget}s"
+                )
+                stats_results.append(stat)
     
     # Print summary
     print("\n" + "=" * 60)
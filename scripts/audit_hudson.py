@@ -7,8 +7,10 @@ and benchmarks LKH against their reported 0.705% gap.
 
 from pathlib import Path
 import numpy as np
+import hashlib
+import json
+import os
 import tempfile
-import shutil
 import sys
 import time
 
@@ -22,54 +24,94 @@ from bee_tsp.core.solver_config import RepairConfig
 # Hudson et al. (2022) Claim: 0.705% gap on N=100
 HUDSON_GAP = 0.705
 
+# Audit setup: the single source for both the solve calls and the cache key
+N_NODES = 100
+REPAIR_TIME_MS = 50  # 50ms budget is usually enough for N=100
+# We give it 1.0s max, but expect it to finish in <0.1s
+SOLVE_KWARGS = {"max_time_s": 1.0, "seed": 42, "candidate_k": 5}
+
+# Memoized LKH results: same (instance, LKH binary, params) -> same tour
+CACHE_DIR = Path("~/.cache/bee_tsp/hudson").expanduser()
+
+def _binary_id(lkh_binary: Path) -> tuple:
+    """Identify the LKH build: resolved path plus mtime and size, so a rebuilt or swapped binary is a miss."""
+    path = lkh_binary.resolve()
+    st = path.stat()
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+def _cache_file(coords: np.ndarray, binary_id: tuple) -> Path:
+    """Cache entry for one solve, keyed by everything that determines its result."""
+    # The instance enters by content, so any change to the generator is a miss
+    instance_digest = hashlib.sha1(np.ascontiguousarray(coords).tobytes()).hexdigest()
+    key = (
+        instance_digest,
+        coords.shape,
+        binary_id,
+        REPAIR_TIME_MS,
+        sorted(SOLVE_KWARGS.items()),
+    )
+    return CACHE_DIR / f"{hashlib.sha1(repr(key).encode()).hexdigest()}.json"
+
 def audit_n100(n_seeds=30):
-    print(f"AUDIT: Generating {n_seeds} instances of N=100 (Uniform Random)")
+    print(f"AUDIT: Generating {n_seeds} instances of N={N_NODES} (Uniform Random)")
     print(f"BASELINE TARGET: Hudson et al. (2022) reported gap = {HUDSON_GAP}%")
     print("-" * 60)
     
-    # Configure LKH (50ms budget is usually enough for N=100)
-    lkh = LKHIntegrator(RepairConfig(time_ms=50))
+    # Configure LKH
+    lkh = LKHIntegrator(RepairConfig(time_ms=REPAIR_TIME_MS))
+    binary_id = _binary_id(lkh.lkh_binary)
     
-    # Create temp directory for instances
-    temp_dir = Path("temp_audit_hudson")
-    temp_dir.mkdir(exist_ok=True)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
     
     results = []
-    runtimes = []
+    runtimes = []  # Measured in this process only (cached runs are not re-timed)
     
-    try:
+    # Temp directory for instances, removed once when the audit finishes
+    with tempfile.TemporaryDirectory(prefix="audit_hudson_") as tmp:
+        temp_dir = Path(tmp)
         for seed in range(n_seeds):
-            # 1. Generate Instance
-            coords = generate_tsp_instance(n_nodes=100, seed=seed)
-            instance_path = temp_dir / f"hudson_audit_{seed}.tsp"
-            write_tsplib_file(instance_path, coords, f"HudsonAudit_{seed}")
-            
-            # 2. Run LKH
-            # We give it 1.0s max, but expect it to finish in <0.1s
-            start_time = time.time()
-            tour, trace = lkh.solve(instance_path, max_time_s=1.0, seed=42, candidate_k=5)
-            duration = time.time() - start_time
+            # 1. Generate Instance (cheap; its coordinates are part of the cache key)
+            coords = generate_tsp_instance(n_nodes=N_NODES, seed=seed)
+            cache_file = _cache_file(coords, binary_id)
+            if cache_file.exists():
+                best_len = json.loads(cache_file.read_text())["best_len"]
+                time_msg = "cached"
+            else:
+                instance_path = temp_dir / f"hudson_audit_{seed}.tsp"
+                write_tsplib_file(instance_path, coords, f"HudsonAudit_{seed}")
+                
+                # 2. Run LKH
+                start_time = time.time()
+                tour, trace = lkh.solve(instance_path, **SOLVE_KWARGS)
+                duration = time.time() - start_time
+                
+                best_len = trace[0][1]
+                # Write-then-rename: an interrupted run never leaves a torn entry
+                tmp = cache_file.with_suffix(f".tmp{os.getpid()}")
+                tmp.write_text(json.dumps({"best_len": best_len}))
+                os.replace(tmp, cache_file)
+                runtimes.append(duration)
+                time_msg = f"{duration*1000:.1f}ms"
             
-            best_len = trace[0][1]
             results.append(best_len)
-            runtimes.append(duration)
             
-            print(f"Instance {seed+1:02d}: LKH Score = {best_len:<10} Time = {duration*1000:.1f}ms")
-
-    finally:
-        # Cleanup
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
+            print(f"Instance {seed+1:02d}: LKH Score = {best_len:<10} Time = {time_msg}")
     
     # --- ANALYSIS ---
     # Since we generated these, we treat LKH as the "Empirical Optimal"
     # If LKH is stable (zero variance on same seeds), it's the floor.
     
-    avg_runtime = np.mean(runtimes) * 1000
+    n_cached = n_seeds - len(runtimes)
     
     print("-" * 60)
     print("RESULTS SUMMARY")
-    print(f"LKH Avg Runtime: {avg_runtime:.1f} ms")
+    if runtimes:
+        avg_runtime = np.mean(runtimes) * 1000
+        cached_note = f", {n_cached} cached runs not timed" if n_cached else ""
+        print(f"LKH Avg Runtime: {avg_runtime:.1f} ms ({len(runtimes)} fresh solves{cached_note})")
+    else:
+        avg_runtime = None
+        print(f"LKH Avg Runtime: n/a (all {n_cached} results cached; clear {CACHE_DIR} to re-time)")
     print(f"LKH Convergence: 100% (No failures)")
     
     print("\nCOMPARISON:")
@@ -80,7 +122,10 @@ def audit_n100(n_seeds=30):
     # If Hudson is 0.705% worse than 0%, the ratio is infinite, 
     # but practically we say 0.705 / 0.01 (LKH noise floor) = ~70x
     print(f"\nVERDICT:")
-    print(f"LKH solves Hudson's exact distribution (N=100) in {avg_runtime:.1f}ms.")
+    if avg_runtime is not None:
+        print(f"LKH solves Hudson's exact distribution (N={N_NODES}) in {avg_runtime:.1f}ms.")
+    else:
+        print(f"LKH solves Hudson's exact distribution (N={N_NODES}) (runtime not re-measured: cached).")
     print(f"Neural methods requiring training are optimizing a solved problem.")
 
 if __name__ == "__main__":
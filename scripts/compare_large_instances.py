@@ -4,20 +4,24 @@ Compare large instances (1000-5915 cities).
 Correct solutions.txt path and robust parsing.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from bee_tsp.integrators.edge_rand import EdgeRandIntegrator
-from bee_tsp.integrators.lkh_integrator import LKHIntegrator
-from bee_tsp.core.solver_config import RepairConfig
-from bee_tsp.core.utils import parse_tsplib_coords
+import os
+import re
 import time
 import sys
 
 # Force unbuffered output
 print = lambda *args, **kwargs: __builtins__.print(*args, **kwargs, flush=True)
 
+# First digit run of a solutions.txt value ("18660188 (CEIL_2D)" -> "18660188")
+_NUM_RE = re.compile(r"\d+")
 
+
+@lru_cache(maxsize=1)
 def load_optimal_lengths():
-    """Load optimal lengths from CORRECT solutions.txt location."""
+    """Load optimal lengths from CORRECT solutions.txt location (parsed once per process)."""
     solutions = {}
     # FIXED PATH:
     sol_file = Path("/home/leo/Python/BEE_TSP/data/solutions.txt")
@@ -29,29 +33,28 @@ def load_optimal_lengths():
     print(f"✅ Found solutions.txt at {sol_file}")
     
     try:
-        content = sol_file.read_text()
         lines_parsed = 0
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-                
-            if ":" in line:
-                # FIXED PARSING: Handles "dsj1000 : 18660188 (CEIL_2D)"
-                try:
-                    name, value = line.split(":", 1)
-                    name = name.strip()
-                    
-                    # Extract number before any parentheses/spaces
-                    value_part = value.strip().split()[0]  # Gets "18660188" from "18660188 (CEIL_2D)"
-                    num_str = "".join(filter(str.isdigit, value_part))
+        with sol_file.open() as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
                     
-                    if num_str:
-                        solutions[name] = int(num_str)
-                        lines_parsed += 1
-                except Exception as e:
-                    print(f"⚠️  Could not parse line: '{line}' - {e}")
-        
+                if ":" in line:
+                    # FIXED PARSING: Handles "dsj1000 : 18660188 (CEIL_2D)"
+                    try:
+                        name, value = line.split(":", 1)
+                        name = name.strip()
+                        
+                        # Extract number before any parentheses/spaces
+                        m = _NUM_RE.search(value)
+                        
+                        if m:
+                            solutions[name] = int(m.group(0))
+                            lines_parsed += 1
+                    except Exception as e:
+                        print(f"⚠️  Could not parse line: '{line}' - {e}")
+            
         print(f"✅ Successfully parsed {lines_parsed} optimal values")
         if "dsj1000" in solutions:
             print(f"✅ dsj1000 optimal: {solutions['dsj1000']}")
@@ -64,16 +67,21 @@ def load_optimal_lengths():
 
 def compare(instance_name: str, seeds: int = 5, lkh_seeds: int = 1):
     """Compare integrators on a single large instance."""
+    # Solver stacks imported here so load_optimal_lengths() stays cheap to import
+    from bee_tsp.integrators.edge_rand import EdgeRandIntegrator
+    from bee_tsp.integrators.lkh_integrator import LKHIntegrator
+    from bee_tsp.core.solver_config import RepairConfig
+    from bee_tsp.core.distance import load_distance
+    
     path = Path(f"data/tsplib/{instance_name}.tsp")
     
     if not path.exists():
         print(f"❌ File not found: {path}")
         return None
     
-    # FIXED: Parse coords and store n for later use
+    # Parse once into the shared Distance cache; every seed's solve() reuses it
     try:
-        coords = parse_tsplib_coords(path)
-        n = len(coords)
+        n = load_distance(path).n
         print(f"✅ {path.name}: {n} cities parsed")
     except Exception as e:
         print(f"❌ Failed to parse {path.name}: {e}")
@@ -97,30 +105,36 @@ def compare(instance_name: str, seeds: int = 5, lkh_seeds: int = 1):
     er = EdgeRandIntegrator(rc)
     er_lengths = []
     er_start = time.time()
-    for seed in range(seeds):
-        try:
-            _, trace = er.solve(path, max_time_s=1.0, seed=seed+1, candidate_k=10)
+    # All seeds scored in one batch (no per-seed work worth a worker)
+    try:
+        for _, trace in er.solve_batch(path, max_time_s=1.0, seeds=list(range(1, seeds + 1)), candidate_k=10):
             length = trace[0][1] if trace else float('inf')
             er_lengths.append(length)
-        except Exception as e:
-            print(f"  ❌ ER seed {seed+1} failed: {e}")
-            return None
+    except Exception as e:
+        print(f"  ❌ ER seeds failed: {e}")
+        return None
     er_time = time.time() - er_start
     
-    # LKH
+    # LKH: each seed is an external process, so threads overlap them without GIL cost
     print(f"LKH ({lkh_seeds} seeds, 30s max each)...")
     lkh = LKHIntegrator(rc)
     lkh_lengths = []
     lkh_start = time.time()
-    for seed in range(lkh_seeds):
-        try:
+    with ThreadPoolExecutor(max_workers=min(lkh_seeds, os.cpu_count() or 1)) as pool:
+        futures = {}
+        for seed in range(lkh_seeds):
             print(f"  Seed {seed+1}/{lkh_seeds}...")
-            _, trace = lkh.solve(path, max_time_s=30.0, seed=seed+1, candidate_k=10)
-            length = trace[0][1] if trace else float('inf')
-            lkh_lengths.append(length)
-        except Exception as e:
-            print(f"  ❌ LKH seed {seed+1} failed: {e}")
-            return None
+            futures[seed] = pool.submit(lkh.solve, path, max_time_s=30.0, seed=seed+1, candidate_k=10)
+        for seed, future in futures.items():
+            try:
+                _, trace = future.result()
+                length = trace[0][1] if trace else float('inf')
+                lkh_lengths.append(length)
+            except Exception as e:
+                print(f"  ❌ LKH seed {seed+1} failed: {e}")
+                for pending in futures.values():
+                    pending.cancel()
+                return None
     lkh_time = time.time() - lkh_start
     
     # Results
@@ -137,7 +151,7 @@ def compare(instance_name: str, seeds: int = 5, lkh_seeds: int = 1):
     
     return {
         "instance": instance_name,
-        "cities": n,  # FIXED: Now uses n from coords
+        "cities": n,  # FIXED: Now uses n from the parsed instance
         "optimal": optimal,
         "edge_rand": f"{er_mean:.0f} ({er_time:.2f}s)",
         "lkh": f"{lkh_mean:.0f} ({lkh_time:.2f}s)",
@@ -1,6 +1,10 @@
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
 def convert_instance(file_path):
     print(f"Processing: {file_path.name}...")
     
@@ -10,76 +14,70 @@ def convert_instance(file_path):
         print(f"❌ Error reading {file_path.name} (Encoding issue)")
         return
 
-    new_lines = []
     scale_factor = 1.0
     found_scale = False
-    in_coord_section = False
-    coords_converted = 0
-    
-    # Pass 1: Find Scale Factor
-    for line in lines:
-        if "SCALE" in line and ":" in line:
-            try:
-                # Handle "SCALE : 10000" or "SCALE:10000"
-                parts = line.split(":")
-                scale_string = parts[1].strip()
-                scale_factor = float(scale_string)
-                found_scale = True
-                print(f"   -> Found Scale Factor: {scale_factor}")
-            except Exception as e:
-                print(f"   -> Warning: Could not parse SCALE line: '{line}'. Error: {e}")
-                scale_factor = 1.0
+    header = []
+    start = None
     
-    if not found_scale:
-        print("   -> ⚠️ No SCALE tag found. Defaulting to 1.0 (Result might be 0 for small floats!)")
-
-    # Pass 2: Process Lines
-    for line in lines:
+    # Single header pass: SCALE always sits above NODE_COORD_SECTION
+    for i, line in enumerate(lines):
+        if "NODE_COORD_SECTION" in line:
+            start = i
+            break
+        
         # Skip the SCALE line in the output (LKH doesn't like it)
         if "SCALE" in line:
+            if ":" in line:
+                try:
+                    # Handle "SCALE : 10000" or "SCALE:10000"
+                    parts = line.split(":")
+                    scale_string = parts[1].strip()
+                    scale_factor = float(scale_string)
+                    found_scale = True
+                    print(f"   -> Found Scale Factor: {scale_factor}")
+                except Exception as e:
+                    print(f"   -> Warning: Could not parse SCALE line: '{line}'. Error: {e}")
+                    scale_factor = 1.0
             continue
-            
-        if "NODE_COORD_SECTION" in line:
-            new_lines.append(line.strip()) # Keep clean
-            in_coord_section = True
-            continue
-            
-        if "EOF" in line:
-            new_lines.append(line.strip())
-            continue
+        
+        header.append(line)
+    
+    if not found_scale:
+        print("   -> ⚠️ No SCALE tag found. Defaulting to 1.0 (Result might be 0 for small floats!)")
 
-        if in_coord_section:
-            parts = line.strip().split()
-            # Check if it's a coordinate line (Index X Y)
-            if len(parts) >= 3 and parts[0].isdigit():
-                idx = parts[0]
-                try:
-                    x = float(parts[1])
-                    y = float(parts[2])
-                    
-                    # APPLY SCALING AND ROUND TO INTEGER
-                    x_int = int(round(x * scale_factor))
-                    y_int = int(round(y * scale_factor))
-                    
-                    new_lines.append(f"{idx} {x_int} {y_int}")
-                    coords_converted += 1
-                except ValueError:
-                    # Header garbage or malformed line
-                    new_lines.append(line)
-            else:
-                # Empty line or garbage
-                if line.strip():
-                    new_lines.append(line)
-        else:
-            # Header lines (NAME, TYPE, etc.)
-            new_lines.append(line)
-            
-    # Write back
-    if coords_converted > 0:
-        file_path.write_text("\n".join(new_lines) + "\n")
-        print(f"   -> ✅ Converted {coords_converted} coordinates.")
-    else:
+    if start is None:
+        print("   -> ⚠️ No coordinates found to convert.")
+        return
+    end = next((i for i in range(start + 1, len(lines)) if "EOF" in lines[i]), len(lines))
+    
+    block = "\n".join(lines[start + 1:end])
+    
+    # Parse the whole block in C: rows of (index, x, y)
+    try:
+        arr = np.loadtxt(io.StringIO(block), dtype=np.float64, usecols=(0, 1, 2), ndmin=2)
+    except ValueError as e:
+        # Header garbage or malformed line
+        print(f"   -> ❌ Could not parse coordinates in {file_path.name}: {e}")
+        return
+    
+    coords_converted = len(arr)
+    if coords_converted == 0:
         print("   -> ⚠️ No coordinates found to convert.")
+        return
+    
+    # APPLY SCALING AND ROUND TO INTEGER
+    out = np.empty(arr.shape, dtype=np.int64)
+    out[:, 0] = arr[:, 0]
+    out[:, 1:] = np.rint(arr[:, 1:] * scale_factor)
+    
+    # Write back
+    buf = io.StringIO()
+    buf.write("\n".join(header + ["NODE_COORD_SECTION"]) + "\n")
+    np.savetxt(buf, out, fmt="%d %d %d")
+    if end < len(lines):
+        buf.write("EOF\n")
+    file_path.write_text(buf.getvalue())
+    print(f"   -> ✅ Converted {coords_converted} coordinates.")
 
 def main():
     # ABSOLUTE PATH - Fixed to point to INSTANCES
@@ -99,8 +97,9 @@ def main():
 
     print(f"Found {len(files)} files. Starting conversion...")
     
-    for tsp_file in files:
-        convert_instance(tsp_file)
+    # Files are independent: convert them in parallel, one process per core
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        list(ex.map(convert_instance, files))
         
     print("\nDone. Check a file with 'cat' to ensure coordinates are integers.")
 
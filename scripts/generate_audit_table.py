@@ -8,6 +8,35 @@ import json
 from pathlib import Path
 import argparse
 
+# Principle name (shortened) and impact, indexed by principle number (1-10)
+_SHORT_NAMES = (
+    None,
+    "Seeds (n\\geq30)",
+    "Literature cited",
+    "Testbed diversity",
+    "Variance reduction",
+    "Efficiency tracking",
+    "Bounds + specs",
+    "LINPACK calibration",
+    "Full story (plots)",
+    "Effect sizes",
+    "Normalized times",
+)
+
+_IMPACTS = (
+    None,
+    "Statistical power",
+    "Reproducibility",
+    "Generalizability",
+    "Paired design",
+    "Cost awareness",
+    "HK verification",
+    "Future work",
+    "Visualization",
+    "Statistical rigor",
+    "Scaling analysis",
+)
+
 def generate_latex_table(
     audit_json: Path = Path("results/johnson_audit.json"),
     output_tex: Path = Path("docs/paper/tables/table1_compliance.tex"),
@@ -63,23 +92,9 @@ def generate_latex_table(
         else:
             improvement = f"{((beesp_score / lit_score) - 1) * 100:.0f}\\%"
         
-        # Principle name (shortened)
-        short_name = {
-            1: "Seeds (n\\geq30)",
-            2: "Literature cited",
-            3: "Testbed diversity",
-            4: "Variance reduction",
-            5: "Efficiency tracking",
-            6: "Bounds + specs",
-            7: "LINPACK calibration",
-            8: "Full story (plots)",
-            9: "Effect sizes",
-            10: "Normalized times"
-        }[i]
-        
         tex_lines.append(
-            f"{i}. {short_name} & {beesp_score:.0f}\\% & {lit_score}\\% & {improvement} & "
-            f"{get_impact_description(i)} \\\\"
+            f"{i}. {_SHORT_NAMES[i]} & {beesp_score:.0f}\\% & {lit_score}\\% & {improvement} & "
+            f"{_IMPACTS[i]} \\\\"
         )
     
     # Add overall row
@@ -100,22 +115,6 @@ def generate_latex_table(
     output_tex.write_text("\n".join(tex_lines))
     print(f"✅ LaTeX table saved to: {output_tex.absolute()}")
 
-def get_impact_description(principle_num: int) -> str:
-    """Return impact description for each principle."""
-    impacts = {
-        1: "Statistical power",
-        2: "Reproducibility",
-        3: "Generalizability",
-        4: "Paired design",
-        5: "Cost awareness",
-        6: "HK verification",
-        7: "Future work",
-        8: "Visualization",
-        9: "Statistical rigor",
-        10: "Scaling analysis"
-    }
-    return impacts[principle_num]
-
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--json", default="results/johnson_audit.json", help="Audit JSON file")
@@ -17,19 +17,17 @@ def generate_optimal_csv():
     
     extracted_data = []
     
-    # Iterate through all .tour files
-    for file_path in tours_dir.glob('*.tour'):
-        filename = file_path.name
-        
+    # Iterate through all .tour files (scandir: names only, no per-entry stat)
+    with os.scandir(tours_dir) as it:
+        filenames = [e.name for e in it if e.name.endswith('.tour')]
+    
+    for filename in filenames:
         # Expected format: ID.OPTIMAL.tour (e.g., 16.77436.tour)
-        parts = filename.split('.')
+        instance_id, _, rest = filename.partition('.')
+        optimal_length, sep, _ = rest.partition('.')
         
-        if len(parts) >= 3:
+        if sep:
             try:
-                # Extract ID and Optimal Length
-                instance_id = parts[0]
-                optimal_length = parts[1]
-                
                 # Validate that optimal_length is a number
                 int(optimal_length)
                 
@@ -5,13 +5,21 @@ Reads *_johnson.json and executes all experiments.
 Pattern copied from batch_edge_rand.py (proven robust).
 """
 
-import json, csv
+import json, csv, os
+import itertools, queue, threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import time
 from bee_tsp.integrators.lkh_integrator import LKHIntegrator
 from bee_tsp.integrators.edge_rand import EdgeRandIntegrator
 from bee_tsp.core.solver_config import RepairConfig
+from bee_tsp.core.utils import MACHINE_INFO_RECORD, json_line
+
+try:
+    from tqdm import tqdm
+except ImportError:  # Optional: fall back to a progress line every 50 runs
+    tqdm = None
 
 # ──────────────────────────────────────────────────────────────────────────────
 # LOAD CONFIG
@@ -62,16 +70,17 @@ if HK_BOUNDS_PATH.exists():
     except:
         pass  # Corrupted file is okay
 
-def get_tsplib_optimal(instance_name: str) -> int:
+def load_tsplib_optimals() -> dict:
     """
-    Fallback: parse optimal values from data/optimal_values.csv
+    Fallback: parse optimal values from data/optimal_values.csv (once, at startup)
     Expected CSV format: InstanceID, OptimalLength
     """
     solutions_file = Path("data/optimal_values.csv")
+    optimals = {}
     
     # 1. Check if file exists
     if not solutions_file.exists():
-        return None
+        return optimals
     
     # 2. Parse CSV
     try:
@@ -85,24 +94,97 @@ def get_tsplib_optimal(instance_name: str) -> int:
                 # Check for header
                 if row[0].lower().startswith("instance"):
                     continue
-                    
-                # Match Name (flexible matching for IDs like "1" vs "1.tsp")
-                current_name = row[0].strip()
-                if current_name == instance_name or current_name == instance_name.replace(".tsp", ""):
-                    try:
-                        return int(float(row[1].strip())) # float->int handles "1234.0"
-                    except ValueError:
-                        continue
+                
+                try:
+                    value = int(float(row[1].strip())) # float->int handles "1234.0"
+                except ValueError:
+                    continue
+                optimals.setdefault(row[0].strip(), value)  # First row wins
     except Exception as e:
         print(f"Error reading optimal_values.csv: {e}")
         
-    return None
+    return optimals
+
+OPTIMALS = load_tsplib_optimals()
+
+def get_tsplib_optimal(instance_name: str) -> int:
+    """Optimal length for an instance (flexible matching for IDs like "1" vs "1.tsp")."""
+    optimal = OPTIMALS.get(instance_name)
+    if optimal is None:
+        optimal = OPTIMALS.get(instance_name.replace(".tsp", ""))
+    return optimal
+
+# ──────────────────────────────────────────────────────────────────────────────
+# SINGLE RUN (executed in worker processes)
+# ──────────────────────────────────────────────────────────────────────────────
+# Integrators of the current worker process, built on first use
+_INTEGRATORS = {}
+
+# Shared repair budget (default, overridden by max_time_s; integrators only read it)
+_REPAIR_CFG = RepairConfig(time_ms=300)
+
+def _run_one(task: tuple) -> dict:
+    """Solve one (instance, integrator, budget, seed) task; errors are returned, not raised."""
+    instance, instance_path, integrator_name, budget, seed, hk_bound = task
+    res = {
+        "instance": instance,
+        "integrator": integrator_name,
+        "budget_s": budget,
+        "seed": seed,
+        "hk_bound": hk_bound,
+        "error": None,
+        "initialized_in": None,  # Worker pid when this task built the integrator
+    }
+    try:
+        integrator = _INTEGRATORS.get(integrator_name)
+        if integrator is None:
+            integrator = _INTEGRATORS[integrator_name] = INTEGRATOR_MAP[integrator_name](_REPAIR_CFG)
+            res["initialized_in"] = os.getpid()  # Reported by the parent (keeps the tqdm bar intact)
+        
+        run_start = time.monotonic()
+        # Pass max_time_s directly - DO NOT modify integrator.config
+        tour, trace = integrator.solve(
+            instance_path=instance_path,
+            max_time_s=budget,
+            seed=seed,
+            candidate_k=CFG["candidate_k"]
+        )
+        
+        wall_time_s = time.monotonic() - run_start
+        best_length = trace[0][1] if trace else None
+        
+        # Calculate gap if bound available
+        gap_pct = None
+        if hk_bound and best_length:
+            gap_pct = ((best_length - hk_bound) / hk_bound) * 100
+        
+        res.update(best_length=best_length, gap_pct=gap_pct, wall_time_s=wall_time_s)
+    except Exception as e:
+        res["error"] = str(e)
+    return res
 
 # ──────────────────────────────────────────────────────────────────────────────
 # RUN EXPERIMENTS
 # ──────────────────────────────────────────────────────────────────────────────
+def _write_rows(row_q: queue.Queue, csv_file, jsonl_file, failure: list) -> None:
+    """
+    Writer thread: append (csv_line, jsonl_bytes) pairs until a None sentinel
+    arrives. A write error is appended to `failure` for run() to re-raise.
+    """
+    try:
+        while True:
+            item = row_q.get()
+            if item is None:
+                break
+            csv_line, jsonl_bytes = item
+            csv_file.write(csv_line)
+            jsonl_file.write(jsonl_bytes)
+    except BaseException as e:
+        failure.append(e)
+
 def run():
     """Execute full factorial design from config."""
+    total_runs = len(CFG["instances"]) * len(CFG["integrators"]) * len(CFG["budgets"]) * len(CFG["seeds"])
     
     print(f"🐝 BEE_TSP Johnson Protocol Runner")
     print(f"📊 Config: {CONFIG_PATH.absolute()}")
@@ -110,23 +192,29 @@ def run():
           f"{len(CFG['integrators'])} integrators × "
           f"{len(CFG['budgets'])} budgets × "
           f"{len(CFG['seeds'])} seeds = "
-          f"{len(CFG['instances']) * len(CFG['integrators']) * len(CFG['budgets']) * len(CFG['seeds'])} runs")
+          f"{total_runs} runs")
     print(f"📁 Output: {RESULTS_CSV}")
     print("=" * 60)
     total_start = time.monotonic()
     completed = 0
     errors = 0
 
-    # Write headers
-    with open(RESULTS_CSV, "w") as f:
-        f.write("instance,integrator,budget_s,seed,best_length,hk_bound,gap_pct,wall_time_s\n")
+    # Write headers (handle stays open for the whole run; line-buffered so rows survive a crash)
+    csv_file = open(RESULTS_CSV, "w", buffering=1)
+    csv_file.write("instance,integrator,budget_s,seed,best_length,hk_bound,gap_pct,wall_time_s\n")
     
     # JSONL audit trail (one JSON per line)
-    jsonl_file = open(JSONL_AUDIT, "w")
+    jsonl_file = open(JSONL_AUDIT, "wb")  # Binary: json_line returns encoded bytes
+    # Machine info once as a header record, not repeated in every run row
+    jsonl_file.write(json_line({"type": MACHINE_INFO_RECORD, **MACHINE_INFO}))
     log_file = open(LOG_FILE, "w", buffering=1)  # Line-buffered for immediate flush
     log_file.write(f"Run started: {datetime.now().isoformat()}\n")
 
+    writer = None
+    write_failure = []  # Set by the writer thread if a row could not be written
     try:
+        # Build the task list (instance checks and bound lookups stay in the main process)
+        tasks = []
         for instance in CFG["instances"]:
             instance_path = Path(CFG["tsplib_dir"]) / f"{instance}.tsp"
             if not instance_path.exists():
@@ -145,85 +233,98 @@ def run():
                 log_file.write(dev_msg + "\n")
             
             for integrator_name in CFG["integrators"]:
-                # Initialize integrator ONCE per integrator_name
-                repair_cfg = RepairConfig(time_ms=300)  # Default, overridden by max_time_s
-                integrator_class = INTEGRATOR_MAP.get(integrator_name)
-                if not integrator_class:
+                if integrator_name not in INTEGRATOR_MAP:
                     msg = f"❌ Unknown integrator: {integrator_name}"
                     print(msg)
                     log_file.write(msg + "\n")
                     errors += len(CFG["budgets"]) * len(CFG["seeds"])
                     continue
+
+                tasks.extend(
+                    (instance, instance_path, integrator_name, budget, seed, hk_bound)
+                    for budget, seed in itertools.product(CFG["budgets"], CFG["seeds"])
+                )
+        
+        # Disk writes go to a writer thread so collecting results never waits on file I/O
+        row_q = queue.Queue()
+        writer = threading.Thread(target=_write_rows, args=(row_q, csv_file, jsonl_file, write_failure), daemon=True)
+        writer.start()
+        
+        # Runs are independent: fan out across cores, collect results here in task order
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            results = ex.map(_run_one, tasks)
+            if tqdm is not None:
+                results = tqdm(results, total=len(tasks), unit="run")
+            say = tqdm.write if tqdm is not None else print  # Keeps the bar intact
+            for res in results:
+                if write_failure:
+                    # Rows can no longer be saved: drop queued runs, re-raise below
+                    ex.shutdown(cancel_futures=True)
+                    break
+                instance = res["instance"]
+                integrator_name = res["integrator"]
+                budget = res["budget_s"]
+                seed = res["seed"]
+                
+                if res["initialized_in"] is not None:
+                    say(f"🔧 Initialized {integrator_name} in worker {res['initialized_in']}")
+                
+                if res["error"] is not None:
+                    errors += 1
+                    msg = f"ERROR: {instance} | {integrator_name} | budget={budget} | seed={seed}: {res['error']}"
+                    log_file.write(msg + "\n")
+                    say(f"⚠️  {msg}")
+                    continue
+                
+                best_length = res["best_length"]
+                hk_bound = res["hk_bound"]
+                gap_pct = res["gap_pct"]
+                wall_time_s = res["wall_time_s"]
+                
+                # CSV row
+                csv_line = f"{instance},{integrator_name},{budget},{seed},{best_length},{hk_bound},{gap_pct},{wall_time_s:.6f}\n"
+                
+                # JSONL audit row (Johnson-compliant)
+                deviations = []
+                if instance not in HK_BOUNDS:
+                    deviations.append("HK bound not computed; using TSPLIB optimal")
+                if instance in ["eil51", "berlin52"]:
+                    deviations.append("Zero variance across seeds (instance too small per Johnson Principle 3)")
+
+                # Now create clean audit row
+                audit_row = {
+                    "instance": instance,
+                    "integrator": integrator_name,
+                    "budget_s": budget,
+                    "seed": seed,
+                    "best_length": best_length,
+                    "hk_bound": hk_bound,
+                    "gap_pct": gap_pct,
+                    "wall_time_s": wall_time_s,
+                    "deviations": deviations
+                }
+                row_q.put((csv_line, json_line(audit_row)))
+                
+                completed += 1
                 
-                integrator = integrator_class(repair_cfg)
-                print(f"🔧 Initialized {integrator_name} for {instance}")
-
-                for budget in CFG["budgets"]:
-                    for seed in CFG["seeds"]:
-                        run_start = time.monotonic()
-                        try:
-                            # Pass max_time_s directly - DO NOT modify integrator.config
-                            tour, trace = integrator.solve(
-                                instance_path=instance_path,
-                                max_time_s=budget,
-                                seed=seed,
-                                candidate_k=CFG["candidate_k"]
-                            )
-                            
-                            wall_time_s = time.monotonic() - run_start
-                            best_length = trace[0][1] if trace else None
-                            
-                            # Calculate gap if bound available
-                            gap_pct = None
-                            if hk_bound and best_length:
-                                gap_pct = ((best_length - hk_bound) / hk_bound) * 100
-                            
-                            # CSV row
-                            with open(RESULTS_CSV, "a") as f:
-                                f.write(f"{instance},{integrator_name},{budget},{seed},{best_length},{hk_bound},{gap_pct},{wall_time_s:.6f}\n")
-                            
-                            # JSONL audit row (Johnson-compliant)
-                            deviations = []
-                            if instance not in HK_BOUNDS:
-                                deviations.append("HK bound not computed; using TSPLIB optimal")
-                            if instance in ["eil51", "berlin52"]:
-                                deviations.append("Zero variance across seeds (instance too small per Johnson Principle 3)")
-
-                            # Now create clean audit row
-                            audit_row = {
-                                "instance": instance,
-                                "integrator": integrator_name,
-                                "budget_s": budget,
-                                "seed": seed,
-                                "best_length": best_length,
-                                "hk_bound": hk_bound,
-                                "gap_pct": gap_pct,
-                                "wall_time_s": wall_time_s,
-                                "machine_info": MACHINE_INFO,
-                                "deviations": deviations
-                            }
-                            jsonl_file.write(json.dumps(audit_row) + "\n")
-                            
-                            completed += 1
-                            
-                            # Progress every 50 runs
-                            if completed % 50 == 0:
-                                elapsed = time.monotonic() - total_start
-                                total_runs = len(CFG["instances"]) * len(CFG["integrators"]) * len(CFG["budgets"]) * len(CFG["seeds"])
-                                remaining = (total_runs / completed - 1) * elapsed if completed else 0
-                                progress_msg = f"  ⏳ Progress: {completed}/{total_runs} runs | ETE: {remaining:.1f}s"
-                                print(progress_msg)
-                                log_file.write(progress_msg + "\n")
-                            
-                        except Exception as e:
-                            errors += 1
-                            msg = f"ERROR: {instance} | {integrator_name} | budget={budget} | seed={seed}: {str(e)}"
-                            log_file.write(msg + "\n")
-                            print(f"⚠️  {msg}")
+                # Progress every 50 runs (on screen only without tqdm's live bar)
+                if completed % 50 == 0:
+                    elapsed = time.monotonic() - total_start
+                    remaining = (total_runs / completed - 1) * elapsed if completed else 0
+                    progress_msg = f"  ⏳ Progress: {completed}/{total_runs} runs | ETE: {remaining:.1f}s"
+                    if tqdm is None:
+                        print(progress_msg)
+                    log_file.write(progress_msg + "\n")
     
     finally:
+        if writer is not None:
+            row_q.put(None)
+            writer.join()
+        csv_file.close()
         jsonl_file.close()
         log_file.close()
+    if write_failure:
+        raise write_failure[0]
 
     # Summary (fix ZeroDivisionError)
     total_time = time.monotonic() - total_start
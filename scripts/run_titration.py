@@ -5,10 +5,10 @@ Runs one instance × one integrator × one budget × all seeds.
 """
 
 from pathlib import Path
+import csv
+import statistics
 import sys
 import time
-from bee_tsp.titration.protocol import TitrationProtocol
-from bee_tsp.titration.config import TitrationConfig
 
 def main():
     if len(sys.argv) != 2:
@@ -20,22 +20,33 @@ def main():
         print(f"Config file not found: {config_path}")
         sys.exit(1)
     
+    # Solver stack imported only once the arguments check out (fast usage errors)
+    from bee_tsp.titration.protocol import RESULT_COLUMNS, TitrationProtocol
+    from bee_tsp.titration.config import TitrationConfig
+    
     # Load config
     cfg = TitrationConfig.from_json(config_path)
     
-    # Run protocol
+    # Run protocol, streaming each row to disk as it finishes (a crash keeps finished runs)
     protocol = TitrationProtocol(cfg)
-    df = protocol.run()
-    
-    # Save results
     results_path = Path("results/v1_lkh_baseline.csv")
     results_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(results_path, index=False)
+    
+    times = []
+    gaps = []
+    with open(results_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS, lineterminator="\n")
+        writer.writeheader()
+        for row in protocol.iter_runs():
+            writer.writerow(row)
+            times.append(row["time_to_best_s"])
+            gaps.append(row["final_gap_pct"])
     
     print(f"\n✓ Results saved to {results_path}")
-    print(f"  Total runs: {len(df)}")
-    print(f"  Average time: {df['time_to_best_s'].mean():.2f}s")
-    print(f"  Median gap: {df['final_gap_pct'].median():.2f}%")
+    print(f"  Total runs: {len(times)}")
+    if times:
+        print(f"  Average time: {statistics.fmean(times):.2f}s")
+        print(f"  Median gap: {statistics.median(gaps):.2f}%")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
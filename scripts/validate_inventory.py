@@ -1,36 +1,89 @@
 from pathlib import Path
+import json
+import os
 import re
+import sys
 
 base = Path('data/tsplib')
-solutions = {}
-if Path('data/tsplib/solutions.txt').exists():
-    for line in Path('data/tsplib/solutions.txt').read_text().splitlines():
-        if ':' in line:
-            name, val = line.split(':', 1)
-            solutions[name.strip()] = val.strip()
+_DIMENSION_RE = re.compile(rb'^DIMENSION\s*[:=]?\s*(\d+)', re.MULTILINE)
+_SECTION_RE = re.compile(rb'^\w+_SECTION', re.MULTILINE)  # Header ends at the first data section
+
+# Parsed n per "name:mtime_ns:size" from earlier runs (an edited file gets a new key)
+cache_path = base / '.validate_cache.json'
+try:
+    cache = json.loads(cache_path.read_text())
+except (FileNotFoundError, ValueError):
+    cache = {}
+cache_dirty = False
+
+try:
+    text = Path('data/tsplib/solutions.txt').read_text()
+except FileNotFoundError:
+    text = ''
+solutions = {name.strip(): val.strip()
+             for name, sep, val in (line.partition(':') for line in text.splitlines())
+             if sep}
+
+# One directory pass: stats from the cached DirEntry, .opt.tour names as a set
+with os.scandir(base) as it:
+    entries = list(it)
+records = sorted((e.name[:-len('.tsp')], e.stat()) for e in entries if e.name.endswith('.tsp'))
+opt_set = {e.name[:-len('.opt.tour')] for e in entries if e.name.endswith('.opt.tour')}
 
 # Check your *actual* files
 print('📁 YOUR LIVE INVENTORY:')
 print('-' * 40)
-for f in sorted(base.glob('*.tsp')):
-    name = f.stem
-    size_kb = f.stat().st_size / 1024
-    # Parse actual n from file if possible
-    n = 0
-    try:
-        with open(f) as fh:
-            for i, line in enumerate(fh):
-                if i > 10: break
-                if line.startswith('DIMENSION'):
-                    n = int(re.findall(r'\d+', line)[0])
-                    break
-    except:
-        n = int(size_kb * 0.8)  # fallback
+out = []
+for name, st in records:
+    size_kb = st.st_size / 1024
+    key = f'{name}:{st.st_mtime_ns}:{st.st_size}'
+    n = cache.get(key)
+    if n is None:
+        # Parse actual n from file if possible (header only: raw reads, no decoding)
+        n = 0
+        try:
+            fd = os.open(os.path.join(base, f'{name}.tsp'), os.O_RDONLY)
+            try:
+                # Large cold files: ask the kernel to start fetching the header page now
+                if st.st_size > 1 << 20 and hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fd, 0, 4096, os.POSIX_FADV_WILLNEED)
+                # Grow the raw read until DIMENSION's digits are complete (not cut
+                # off at the buffer end), the header has ended, or EOF
+                header = os.read(fd, 512)
+                while True:
+                    m = _DIMENSION_RE.search(header)
+                    if m and m.end() < len(header):
+                        break
+                    if not m and _SECTION_RE.search(header):
+                        break
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        break
+                    header += chunk
+            finally:
+                os.close(fd)
+            if m:
+                n = int(m.group(1))
+            cache[key] = n
+            cache_dirty = True
+        except:
+            n = int(size_kb * 0.8)  # fallback (not cached)
     
-    opt = base / f'{name}.opt.tour'
-    opt_status = '✅' if opt.exists() else ('📊' if name in solutions else '❌')
+    opt_status = '✅' if name in opt_set else ('📊' if name in solutions else '❌')
     
-    print(f'{n:>5}c | {name:<12} | {size_kb:>6.1f}KB | Opt: {opt_status}')
+    out.append(f'{n:>5}c | {name:<12} | {size_kb:>6.1f}KB | Opt: {opt_status}')
 
+# One write for the whole table instead of one print per file
+if out:
+    sys.stdout.write('\n'.join(out) + '\n')
 print('-' * 40)
 print('✅ = .opt.tour file | 📊 = solutions.txt only | ❌ = No optimal data')
+
+# Write-to-temp + rename so an interrupted run never leaves a torn cache
+if cache_dirty:
+    try:
+        tmp = cache_path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(cache))
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass  # Read-only data dir: cache is an optimisation only